@@ -1,11 +1,16 @@
 import csv
 import io
 import os  # <--- Essencial para ler configurações do Render
-import xml.etree.ElementTree as ET
-from flask import Flask, render_template, request, redirect, url_for, Response, flash
+from flask import Flask, render_template, request, redirect, url_for, Response, flash, stream_with_context
 from flask_sqlalchemy import SQLAlchemy
+from flask_compress import Compress
+from sqlalchemy import bindparam, func, select, update
+from sqlalchemy.orm import joinedload, raiseload
 from datetime import datetime
-from werkzeug.security import generate_password_hash, check_password_hash
+from functools import lru_cache
+from werkzeug.security import check_password_hash
+from argon2 import PasswordHasher
+from argon2.exceptions import VerificationError, InvalidHashError
 from flask_login import LoginManager, UserMixin, login_user, login_required, logout_user, current_user
 
 app = Flask(__name__)
@@ -29,8 +34,37 @@ if database_url and database_url.startswith("postgres://"):
 app.config['SQLALCHEMY_DATABASE_URI'] = database_url or 'sqlite:///estoque.db'
 app.config['SQLALCHEMY_TRACK_MODIFICATIONS'] = False
 
+# 3. POOL DE CONEXÕES (só no PostgreSQL do Render)
+# Mantém conexões abertas entre as requisições e reabre as que o Render fechou por inatividade.
+# Para muitos workers, dá para apontar o DATABASE_URL para um PgBouncer (modo transaction).
+if database_url:
+    app.config['SQLALCHEMY_ENGINE_OPTIONS'] = {
+        'pool_size': int(os.environ.get('DB_POOL_SIZE', 10)),
+        'max_overflow': int(os.environ.get('DB_MAX_OVERFLOW', 20)),
+        'pool_pre_ping': True,
+        'pool_recycle': 300,
+    }
+
+# 4. PROFILING (opcional)
+# Com FLASK_PROFILE=1, cada requisição grava um arquivo .prof em ./profiles (abra com o snakeviz).
+if os.environ.get('FLASK_PROFILE') == '1':
+    from werkzeug.middleware.profiler import ProfilerMiddleware
+    os.makedirs('profiles', exist_ok=True)
+    app.wsgi_app = ProfilerMiddleware(app.wsgi_app, restrictions=[30], profile_dir='profiles')
+
+# 5. COMPRESSÃO E CACHE
+# Comprime HTML/CSS/CSV com gzip/br. Os arquivos estáticos já levam ?v=mtime na URL,
+# então o navegador pode guardá-los por um ano.
+app.config['COMPRESS_MIMETYPES'] = ['text/html', 'text/css', 'text/javascript', 'application/javascript', 'application/json', 'text/csv']
+app.config['SEND_FILE_MAX_AGE_DEFAULT'] = 31536000
+Compress(app)
+
 db = SQLAlchemy(app)
 
+# --- HASH DE SENHAS (Argon2id) ---
+# Senhas antigas (pbkdf2 do Werkzeug) continuam funcionando e são convertidas no próximo login.
+password_hasher = PasswordHasher(time_cost=2, memory_cost=64 * 1024, parallelism=2)
+
 # --- CONFIGURAÇÃO DE LOGIN ---
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -38,7 +72,9 @@ login_manager.login_view = 'login'
 
 @login_manager.user_loader
 def load_user(user_id):
-    return User.query.get(int(user_id))
+    # Consulta o identity map da sessão antes de ir ao banco. O Flask-Login guarda o
+    # resultado em g durante a requisição, então roda no máximo uma vez por request.
+    return db.session.get(User, int(user_id))
 
 # ==========================================
 # MODELOS (TABELAS)
@@ -46,23 +82,40 @@ def load_user(user_id):
 
 class User(UserMixin, db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    username = db.Column(db.String(100), unique=True, nullable=False)
+    username = db.Column(db.String(100), unique=True, index=True, nullable=False)
     password_hash = db.Column(db.String(200), nullable=False)
 
     def set_password(self, password):
-        self.password_hash = generate_password_hash(password)
+        self.password_hash = password_hasher.hash(password)
 
     def check_password(self, password):
-        return check_password_hash(self.password_hash, password)
+        if not self.password_hash.startswith('$argon2'):
+            return check_password_hash(self.password_hash, password)
+        try:
+            return password_hasher.verify(self.password_hash, password)
+        except (VerificationError, InvalidHashError):
+            return False
+
+    def precisa_rehash(self):
+        """True se o hash é do formato antigo (pbkdf2) ou usa parâmetros desatualizados."""
+        if not self.password_hash.startswith('$argon2'):
+            return True
+        return password_hasher.check_needs_rehash(self.password_hash)
 
 class Produto(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    nome = db.Column(db.String(100), nullable=False)
+    nome = db.Column(db.String(100), nullable=False, index=True)
     quantidade = db.Column(db.Integer, nullable=False)
     preco = db.Column(db.Float, nullable=False)
     preco_compra = db.Column(db.Float, nullable=True)
     validade = db.Column(db.String(20), nullable=True)
 
+    # Índice parcial só com os produtos de estoque baixo (usado nos relatórios)
+    __table_args__ = (
+        db.Index('ix_produto_baixo', 'quantidade',
+                 postgresql_where=db.text('quantidade < 5'), sqlite_where=db.text('quantidade < 5')),
+    )
+
 class Cliente(db.Model):
     id = db.Column(db.Integer, primary_key=True)
     nome = db.Column(db.String(100), nullable=False)
@@ -72,19 +125,63 @@ class Cliente(db.Model):
 
 class Venda(db.Model):
     id = db.Column(db.Integer, primary_key=True)
-    data = db.Column(db.DateTime, default=datetime.now)
+    data = db.Column(db.DateTime, default=datetime.now, index=True)
     quantidade = db.Column(db.Integer, nullable=False)
     valor_total = db.Column(db.Float, nullable=False)
     
-    produto_id = db.Column(db.Integer, db.ForeignKey('produto.id'), nullable=False)
-    cliente_id = db.Column(db.Integer, db.ForeignKey('cliente.id'), nullable=True)
+    produto_id = db.Column(db.Integer, db.ForeignKey('produto.id'), nullable=False, index=True)
+    cliente_id = db.Column(db.Integer, db.ForeignKey('cliente.id'), nullable=True, index=True)
     
     produto = db.relationship('Produto')
     cliente = db.relationship('Cliente')
 
-# Cria tabelas (Importante: No Render, isso roda ao iniciar)
-with app.app_context():
+def criar_tabelas():
     db.create_all()
+    # create_all não mexe em tabelas que já existem: cria os índices que estiverem faltando
+    for tabela in db.metadata.sorted_tables:
+        for indice in tabela.indexes:
+            indice.create(db.engine, checkfirst=True)
+
+# Cria tabelas e índices. No Render, rode uma vez no build/release: flask --app app init-db
+@app.cli.command('init-db')
+def init_db_command():
+    criar_tabelas()
+    print('Banco de dados pronto.')
+
+# ==========================================
+# UTILITÁRIOS
+# ==========================================
+
+class PseudoBuffer:
+    """Objeto 'arquivo' que só devolve o que recebe.
+    Permite usar csv.writer para gerar linhas e enviá-las direto na resposta (streaming)."""
+    def write(self, value):
+        return value
+
+def linha_csv(valores):
+    """Converte uma linha em bytes CSV (UTF-8)."""
+    return csv.writer(PseudoBuffer()).writerow(valores).encode('utf-8')
+
+def gerar_csv(cabecalho, linhas, tamanho_bloco=500):
+    """Gera o CSV em blocos de bytes: o cabeçalho já vem pronto e as linhas são agrupadas
+    para não fazer uma escrita no WSGI por linha."""
+    yield cabecalho
+    writer = csv.writer(PseudoBuffer())
+    bloco = []
+    for linha in linhas:
+        bloco.append(writer.writerow(linha))
+        if len(bloco) >= tamanho_bloco:
+            yield ''.join(bloco).encode('utf-8')
+            bloco.clear()
+    if bloco:
+        yield ''.join(bloco).encode('utf-8')
+
+# Cabeçalhos dos CSVs, montados uma vez só
+CSV_MODELO = linha_csv(('nome', 'quantidade', 'preco_venda', 'preco_custo', 'validade'))
+CSV_MODELO_EXEMPLO = linha_csv(('Exemplo Camiseta', '10', '50.00', '25.00', ''))
+CSV_PRODUTOS = linha_csv(('ID', 'Nome', 'Quantidade', 'Preço Venda', 'Preço Custo'))
+CSV_VENDAS = linha_csv(('ID', 'Data', 'Produto', 'Cliente', 'Qtd', 'Total'))
+CSV_CLIENTES = linha_csv(('ID', 'Nome', 'Telefone', 'Email', 'Cidade'))
 
 # ==========================================
 # ROTAS DE AUTENTICAÇÃO
@@ -101,6 +198,9 @@ def login():
         user = User.query.filter_by(username=username).first()
         
         if user and user.check_password(password):
+            if user.precisa_rehash():
+                user.set_password(password)
+                db.session.commit()
             login_user(user)
             return redirect(url_for('index'))
         else:
@@ -139,11 +239,15 @@ def logout():
 # ROTAS DO SISTEMA (ESTOQUE)
 # ==========================================
 
+# Quantidade de linhas por página nas listagens (produtos e vendas)
+POR_PAGINA = 50
+
 @app.route('/')
 @login_required
 def index():
-    produtos = Produto.query.all()
-    return render_template('index.html', produtos=produtos, pagina_atual='estoque')
+    pagina = request.args.get('page', 1, type=int)
+    pagination = Produto.query.order_by(Produto.id).paginate(page=pagina, per_page=POR_PAGINA, error_out=False)
+    return render_template('index.html', pagination=pagination, pagina_atual='estoque')
 
 @app.route('/adicionar', methods=['GET', 'POST'])
 @login_required
@@ -238,8 +342,11 @@ def deletar_cliente(id):
 @app.route('/vendas')
 @login_required
 def vendas():
-    lista_vendas = Venda.query.order_by(Venda.data.desc()).all()
-    return render_template('vendas.html', vendas=lista_vendas, pagina_atual='vendas')
+    # Carrega produto e cliente no mesmo SELECT (evita N+1); qualquer outro lazy load gera erro
+    pagina = request.args.get('page', 1, type=int)
+    pagination = (Venda.query.options(joinedload(Venda.produto), joinedload(Venda.cliente), raiseload('*'))
+                  .order_by(Venda.data.desc()).paginate(page=pagina, per_page=POR_PAGINA, error_out=False))
+    return render_template('vendas.html', pagination=pagination, pagina_atual='vendas')
 
 @app.route('/vendas/nova', methods=['GET', 'POST'])
 @login_required
@@ -248,18 +355,29 @@ def nova_venda():
         produto_id = int(request.form['produto_id'])
         cliente_id_form = request.form.get('cliente_id')
         quantidade = int(request.form['quantidade'])
-        produto = Produto.query.get(produto_id)
+        # Baixa o estoque e confere o saldo num único UPDATE atômico (evita vender o mesmo item duas vezes)
+        baixa = db.session.execute(
+            update(Produto)
+            .where(Produto.id == produto_id, Produto.quantidade >= quantidade)
+            .values(quantidade=Produto.quantidade - quantidade)
+            .returning(Produto.preco)
+        ).first()
         
-        if produto.quantidade < quantidade:
-            flash(f'Estoque insuficiente! Restam {produto.quantidade}.', 'danger')
+        if baixa is None:
+            # Nenhuma linha alterada: só aqui lemos o produto, para montar a mensagem
+            db.session.rollback()
+            produto = db.session.get(Produto, produto_id)
+            if produto is None:
+                flash('Produto não encontrado.', 'danger')
+            else:
+                flash(f'Estoque insuficiente! Restam {produto.quantidade}.', 'danger')
             return redirect(url_for('nova_venda'))
 
-        valor_total = produto.preco * quantidade
+        valor_total = baixa.preco * quantidade
         nova_venda = Venda(
             produto_id=produto_id, cliente_id=int(cliente_id_form) if cliente_id_form else None,
             quantidade=quantidade, valor_total=valor_total
         )
-        produto.quantidade -= quantidade
         db.session.add(nova_venda)
         db.session.commit()
         flash('Venda registrada!', 'success')
@@ -273,32 +391,34 @@ def nova_venda():
 @app.route('/relatorios')
 @login_required
 def relatorios():
-    produtos = Produto.query.all()
-    vendas = Venda.query.all()
-    
-    total_faturamento = sum(v.valor_total for v in vendas)
-    total_itens_vendidos = sum(v.quantidade for v in vendas)
-    valor_estoque_custo = sum((p.preco_compra or 0) * p.quantidade for p in produtos)
-    valor_estoque_venda = sum(p.preco * p.quantidade for p in produtos)
+    # Todas as somas e agrupamentos são feitos pelo banco; o Python só formata
+    total_faturamento, total_itens_vendidos = db.session.query(
+        func.coalesce(func.sum(Venda.valor_total), 0), func.coalesce(func.sum(Venda.quantidade), 0)
+    ).one()
+    valor_estoque_venda, valor_estoque_custo = db.session.query(
+        func.coalesce(func.sum(Produto.preco * Produto.quantidade), 0),
+        func.coalesce(func.sum(func.coalesce(Produto.preco_compra, 0) * Produto.quantidade), 0)
+    ).one()
     lucro_estimado_estoque = valor_estoque_venda - valor_estoque_custo
     
-    vendas_por_produto = {}
-    for v in vendas:
-        if v.produto: 
-            vendas_por_produto[v.produto.nome] = vendas_por_produto.get(v.produto.nome, 0) + v.quantidade
-    grafico_prod_labels = list(vendas_por_produto.keys())
-    grafico_prod_values = list(vendas_por_produto.values())
-
-    faturamento_diario = {}
-    for v in vendas:
-        dt = v.data.strftime('%d/%m')
-        faturamento_diario[dt] = faturamento_diario.get(dt, 0) + v.valor_total
-    grafico_dia_labels = list(faturamento_diario.keys())
-    grafico_dia_values = list(faturamento_diario.values())
+    # Gráficos recebem pares [rótulo, valor] (mantém a ordem da consulta; o tojson ordenaria as chaves de um dict)
+    vendas_por_produto = [tuple(linha) for linha in
+                          db.session.query(Produto.nome, func.sum(Venda.quantidade))
+                          .join(Venda, Venda.produto_id == Produto.id)
+                          .group_by(Produto.nome).order_by(func.min(Venda.id))]
+
+    # Dia no formato dd/mm (PostgreSQL no Render, SQLite no PC)
+    if db.engine.dialect.name == 'postgresql':
+        dia = func.to_char(Venda.data, 'DD/MM')
+    else:
+        dia = func.strftime('%d/%m', Venda.data)
+    faturamento_diario = [tuple(linha) for linha in
+                          db.session.query(dia, func.sum(Venda.valor_total))
+                          .group_by(dia).order_by(func.min(Venda.data))]
     
-    estoque_baixo = [p for p in produtos if p.quantidade < 5]
+    estoque_baixo = Produto.query.filter(Produto.quantidade < 5).all()
     
-    return render_template('relatorios.html', pagina_atual='relatorios', total_faturamento=total_faturamento, total_itens_vendidos=total_itens_vendidos, valor_estoque_custo=valor_estoque_custo, valor_estoque_venda=valor_estoque_venda, lucro_estimado=lucro_estimado_estoque, grafico_prod_labels=grafico_prod_labels, grafico_prod_values=grafico_prod_values, grafico_dia_labels=grafico_dia_labels, grafico_dia_values=grafico_dia_values, estoque_baixo=estoque_baixo)
+    return render_template('relatorios.html', pagina_atual='relatorios', total_faturamento=total_faturamento, total_itens_vendidos=total_itens_vendidos, valor_estoque_custo=valor_estoque_custo, valor_estoque_venda=valor_estoque_venda, lucro_estimado=lucro_estimado_estoque, vendas_por_produto=vendas_por_produto, faturamento_diario=faturamento_diario, estoque_baixo=estoque_baixo)
 
 # --- GERENCIAMENTO (CSV & MODELOS) ---
 @app.route('/gerenciamento')
@@ -309,12 +429,12 @@ def gerenciamento():
 @app.route('/baixar_modelo')
 @login_required
 def baixar_modelo():
-    output = io.StringIO()
-    writer = csv.writer(output)
-    writer.writerow(['nome', 'quantidade', 'preco_venda', 'preco_custo', 'validade'])
-    writer.writerow(['Exemplo Camiseta', '10', '50.00', '25.00', ''])
-    output.seek(0)
-    return Response(output, mimetype="text/csv", headers={"Content-Disposition": "attachment;filename=modelo_estoque.csv"})
+    resposta = Response(CSV_MODELO + CSV_MODELO_EXEMPLO, mimetype="text/csv", headers={"Content-Disposition": "attachment;filename=modelo_estoque.csv"})
+    # O modelo nunca muda entre deploys: o navegador reaproveita (ETag -> 304)
+    resposta.cache_control.private = True
+    resposta.cache_control.max_age = 3600
+    resposta.add_etag()
+    return resposta.make_conditional(request)
 
 @app.route('/importar_csv', methods=['POST'])
 @login_required
@@ -327,30 +447,66 @@ def importar_csv():
         flash('Selecione um arquivo.', 'danger')
         return redirect(url_for('gerenciamento'))
     try:
-        stream = io.StringIO(arquivo.stream.read().decode("UTF8"), newline=None)
+        # Lê o arquivo linha a linha direto do upload (sem decodificar tudo na memória)
+        stream = io.TextIOWrapper(arquivo.stream, encoding='utf-8', newline='')
         csv_input = csv.reader(stream)
         next(csv_input, None) 
-        count_novos = 0
-        count_at = 0
+        linhas = []
         for row in csv_input:
             if not row or len(row) < 3: continue
             try:
                 nome = row[0].strip()
                 if not nome: continue
-                qtd = int(row[1])
-                preco_venda = float(row[2].replace(',', '.'))
-                preco_custo = float(row[3].replace(',', '.')) if len(row)>3 and row[3] else 0.0
-                validade = row[4].strip() if len(row)>4 else ""
-                
-                prod = Produto.query.filter_by(nome=nome).first()
-                if prod:
-                    prod.quantidade += qtd
-                    if preco_custo > 0: prod.preco_compra = preco_custo
-                    count_at += 1
-                else:
-                    db.session.add(Produto(nome=nome, quantidade=qtd, preco=preco_venda, preco_compra=preco_custo, validade=validade))
-                    count_novos += 1
+                linhas.append({
+                    'nome': nome,
+                    'quantidade': int(row[1]),
+                    'preco': float(row[2].replace(',', '.')),
+                    'preco_compra': float(row[3].replace(',', '.')) if len(row)>3 and row[3] else 0.0,
+                    'validade': row[4].strip() if len(row)>4 else ""
+                })
             except ValueError: continue
+
+        # Um único SELECT (só id e nome) para todos os nomes do arquivo, sem carregar objetos no ORM
+        existentes = {}
+        nomes = {d['nome'] for d in linhas}
+        if nomes:
+            consulta = select(Produto.id, Produto.nome).where(Produto.nome.in_(nomes)).order_by(Produto.id)
+            for prod_id, nome in db.session.execute(consulta):
+                existentes.setdefault(nome, prod_id)
+
+        novos = {}
+        atualizacoes = {}
+        count_at = 0
+        for d in linhas:
+            if d['nome'] in existentes:
+                at = atualizacoes.setdefault(existentes[d['nome']], {'b_qtd': 0, 'b_custo': None})
+            elif d['nome'] in novos:
+                # Nome repetido no próprio arquivo: soma no produto que será criado
+                at = novos[d['nome']]
+                at['quantidade'] += d['quantidade']
+                if d['preco_compra'] > 0: at['preco_compra'] = d['preco_compra']
+                count_at += 1
+                continue
+            else:
+                novos[d['nome']] = d
+                continue
+            at['b_qtd'] += d['quantidade']
+            if d['preco_compra'] > 0: at['b_custo'] = d['preco_compra']
+            count_at += 1
+        count_novos = len(novos)
+
+        # Inserts e updates vão em lote (executemany), sem passar pelo unit-of-work do ORM
+        tabela = Produto.__table__
+        if novos:
+            db.session.execute(tabela.insert(), list(novos.values()))
+        if atualizacoes:
+            db.session.execute(
+                tabela.update()
+                .where(tabela.c.id == bindparam('b_id'))
+                .values(quantidade=tabela.c.quantidade + bindparam('b_qtd'),
+                        preco_compra=func.coalesce(bindparam('b_custo'), tabela.c.preco_compra)),
+                [dict(at, b_id=prod_id) for prod_id, at in atualizacoes.items()]
+            )
         db.session.commit()
         flash(f'Importação: {count_novos} novos, {count_at} atualizados.', 'success')
         return redirect(url_for('index'))
@@ -361,26 +517,22 @@ def importar_csv():
 @app.route('/exportar/<tipo>')
 @login_required
 def exportar(tipo):
-    output = io.StringIO()
-    writer = csv.writer(output)
-    filename = "dados.csv"
-    if tipo == 'produtos':
-        filename = "produtos.csv"
-        writer.writerow(['ID', 'Nome', 'Quantidade', 'Preço Venda', 'Preço Custo'])
-        for i in Produto.query.all(): writer.writerow([i.id, i.nome, i.quantidade, i.preco, i.preco_compra])
-    elif tipo == 'vendas':
-        filename = "vendas.csv"
-        writer.writerow(['ID', 'Data', 'Produto', 'Cliente', 'Qtd', 'Total'])
-        for i in Venda.query.all():
-            p_nome = i.produto.nome if i.produto else "Removido"
-            c_nome = i.cliente.nome if i.cliente else 'Balcão'
-            writer.writerow([i.id, i.data, p_nome, c_nome, i.quantidade, i.valor_total])
-    elif tipo == 'clientes':
-        filename = "clientes.csv"
-        writer.writerow(['ID', 'Nome', 'Telefone', 'Email', 'Cidade'])
-        for i in Cliente.query.all(): writer.writerow([i.id, i.nome, i.telefone, i.email, i.cidade])
-    output.seek(0)
-    return Response(output, mimetype="text/csv", headers={"Content-Disposition": f"attachment;filename={filename}"})
+    # Gera o CSV aos poucos (memória constante, mesmo com tabelas grandes)
+    def gerar():
+        if tipo == 'produtos':
+            linhas = ((i.id, i.nome, i.quantidade, i.preco, i.preco_compra) for i in Produto.query.yield_per(500))
+            yield from gerar_csv(CSV_PRODUTOS, linhas)
+        elif tipo == 'vendas':
+            consulta = Venda.query.options(joinedload(Venda.produto), joinedload(Venda.cliente), raiseload('*'))
+            linhas = ((i.id, i.data, i.produto.nome if i.produto else "Removido",
+                       i.cliente.nome if i.cliente else 'Balcão', i.quantidade, i.valor_total)
+                      for i in consulta.yield_per(500))
+            yield from gerar_csv(CSV_VENDAS, linhas)
+        elif tipo == 'clientes':
+            linhas = ((i.id, i.nome, i.telefone, i.email, i.cidade) for i in Cliente.query.yield_per(500))
+            yield from gerar_csv(CSV_CLIENTES, linhas)
+    filename = f"{tipo}.csv" if tipo in ('produtos', 'vendas', 'clientes') else "dados.csv"
+    return Response(stream_with_context(gerar()), mimetype="text/csv", headers={"Content-Disposition": f"attachment;filename={filename}"})
 
 @app.route('/limpar_vendas')
 @login_required
@@ -396,15 +548,26 @@ def limpar_vendas():
         return redirect(url_for('gerenciamento'))
 
 # Cache Busting para atualizar CSS no navegador
+# O mtime de cada arquivo é lido uma vez por processo (cada deploy sobe processos novos).
+# Em modo debug (no seu PC) lê sempre, para o CSS editado aparecer sem reiniciar.
+@lru_cache(maxsize=256)
+def _static_mtime(file_path):
+    if os.path.exists(file_path):
+        return int(os.stat(file_path).st_mtime)
+    return None
+
 @app.url_defaults
 def hashed_url_for_static_file(endpoint, values):
     if 'static' == endpoint or endpoint.endswith('.static'):
         filename = values.get('filename')
         if filename:
-            static_folder = app.static_folder
-            file_path = os.path.join(static_folder, filename)
-            if os.path.exists(file_path):
-                values['v'] = int(os.stat(file_path).st_mtime)
+            file_path = os.path.join(app.static_folder, filename)
+            mtime = _static_mtime.__wrapped__(file_path) if app.debug else _static_mtime(file_path)
+            if mtime is not None:
+                values['v'] = mtime
 
 if __name__ == "__main__":
+    # No PC: garante as tabelas antes de subir o servidor de desenvolvimento
+    with app.app_context():
+        criar_tabelas()
     app.run(debug=True)
\ No newline at end of file